@@ -1,8 +1,27 @@
 import os
 import sys
+import types
 
-# Point Sphinx at the generated bindings so autodoc can import the module
-sys.path.insert(0, os.path.abspath("../src/coinswap/native/linux-x86_64"))
+# Import the package from src/; it loads the generated bindings lazily
+sys.path.insert(0, os.path.abspath("../src"))
+import coinswap
+from coinswap import _native_loader
+
+if not os.path.exists(os.path.join(_native_loader.native_dir(), "coinswap.py")):
+    # No generated bindings: document the package against placeholders for
+    # its exported names so the build does not need the native library.
+    _stub = types.ModuleType("coinswap.coinswap")
+    for _name in coinswap.__all__:
+        _doc = f"``{_name}`` from the generated UniFFI bindings."
+        if _name[0].isupper():
+            _obj = type(_name, (), {"__doc__": _doc, "__module__": "coinswap"})
+        else:
+            _obj = lambda *args, **kwargs: None
+            _obj.__name__ = _obj.__qualname__ = _name
+            _obj.__doc__ = _doc
+            _obj.__module__ = "coinswap"
+        setattr(_stub, _name, _obj)
+    sys.modules["coinswap.coinswap"] = _stub
 
 project = "Coinswap Python"
 copyright = "2026, Citadel-Tech"
@@ -34,6 +53,3 @@ html_theme_options = {
     "source_branch": "main",
     "source_directory": "coinswap-python/docs/",
 }
-
-# Suppress warnings about missing native library during doc generation
-autodoc_mock_imports = []
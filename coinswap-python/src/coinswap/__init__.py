@@ -1,13 +1,78 @@
-"""Coinswap Python bindings package."""
+"""Coinswap Python bindings package.
+
+The native bindings are loaded lazily on first attribute access, so importing
+the package does not load the Rust library until a binding is actually used.
+"""
 
 from __future__ import annotations
 
-from importlib import import_module
+import threading
+import warnings
+
+from . import _native_loader
+
+# Public names exported by the generated ``coinswap.py`` module. Keep in sync
+# with the UniFFI interface in ``ffi-commons/src``.
+__all__ = (
+    "InternalError",
+    # Objects
+    "Taker",
+    # Errors
+    "TakerError",
+    # Enums
+    "TakerBehavior",
+    # Records
+    "Address",
+    "AddressType",
+    "Amount",
+    "Balances",
+    "FeeRates",
+    "FidelityBond",
+    "FidelityProof",
+    "FullStatus",
+    "GetTransactionResultDetail",
+    "ListTransactionResult",
+    "ListUnspentResultEntry",
+    "LockTime",
+    "MakerAddress",
+    "MakerFeeInfo",
+    "MakerOfferCandidate",
+    "MakerProtocol",
+    "MakerState",
+    "Offer",
+    "OfferBook",
+    "OfferSummary",
+    "OutPoint",
+    "PublicKey",
+    "RpcConfig",
+    "ScriptBuf",
+    "SignedAmountSats",
+    "SwapParams",
+    "SwapReport",
+    "TotalUtxoInfo",
+    "TxRow",
+    "Txid",
+    "UtxoSpendInfo",
+    "UtxoWithAddress",
+    "WalletTxInfo",
+    # Functions
+    "coinswap_ffi_version",
+    "create_default_rpc_config",
+    "fetch_mempool_fees",
+    "is_wallet_encrypted",
+    "restore_wallet_gui_app",
+    "setup_logging",
+)
+
+_bindings = None
+# Serializes the first load so concurrent first accesses never see a partly
+# executed bindings module.
+_bindings_lock = threading.Lock()
 
 
 def _load_bindings():
     try:
-        return import_module(".coinswap", __name__)
+        return _native_loader.load(__name__ + ".coinswap")
     except Exception as exc:  # pragma: no cover - simple import shim
         raise ImportError(
             "Coinswap bindings are not generated. Run ffi-commons/create_bindings.sh "
@@ -16,17 +81,60 @@ def _load_bindings():
         ) from exc
 
 
-_bindings = _load_bindings()
+def _check_exports(bindings):
+    """Warn if the static ``__all__`` has drifted from the generated module."""
+    generated = getattr(bindings, "__all__", None)
+    if generated is None:
+        return
+    missing = sorted(set(__all__) - set(vars(bindings)))
+    # UniFFI may also list each object's typing Protocol; only the object is API here.
+    unlisted = sorted(
+        name
+        for name in set(generated) - set(__all__)
+        if not (name.endswith("Protocol") and name[: -len("Protocol")] in __all__)
+    )
+    if missing or unlisted:
+        warnings.warn(
+            f"coinswap.__all__ is out of sync with the generated bindings "
+            f"(missing from bindings: {missing}, not exported: {unlisted}); "
+            f"update __all__ in {__name__}/__init__.py",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
 
-_export_names = getattr(_bindings, "__all__", None)
-if _export_names is None:
-    _export_names = [
-        _name
-        for _name in dir(_bindings)
-        if not _name.startswith("_")
-    ]
+def __getattr__(name):
+    global _bindings
+    if name.startswith("_"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _bindings is None:
+        with _bindings_lock:
+            # Another thread may have finished the load while this one waited.
+            if _bindings is None:
+                try:
+                    bindings = _load_bindings()
+                except ImportError as exc:
+                    # A public export keeps the ImportError and its create_bindings.sh
+                    # hint; from-imports would swallow an AttributeError's message.
+                    if name in __all__:
+                        raise
+                    # Anything else stays an AttributeError, so hasattr() and
+                    # getattr() with a default still work without generated bindings.
+                    raise AttributeError(
+                        f"module {__name__!r} has no attribute {name!r}"
+                    ) from exc
+                _check_exports(bindings)
+                # Publish every export at once so later lookups bypass __getattr__.
+                _src = vars(bindings)
+                globals().update({_name: _src[_name] for _name in __all__ if _name in _src})
+                _bindings = bindings
+    try:
+        return getattr(_bindings, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
 
-for _name in _export_names:
-    globals()[_name] = getattr(_bindings, _name)
 
-__all__ = list(_export_names)
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,54 @@
+"""Locate and load the generated bindings for the running platform."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import platform
+import sys
+
+_NATIVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "native")
+
+# (sys.platform, platform.machine()) -> resource directory under native/
+_PLATFORM_DIRS = {
+    ("linux", "x86_64"): "linux-x86_64",
+    ("linux", "amd64"): "linux-x86_64",
+    ("linux", "aarch64"): "linux-aarch64",
+    ("linux", "arm64"): "linux-aarch64",
+    ("darwin", "x86_64"): "darwin-x86_64",
+    ("darwin", "arm64"): "darwin-arm64",
+    ("win32", "amd64"): "win-amd64",
+    ("win32", "x86_64"): "win-amd64",
+}
+
+
+def native_dir():
+    """Return the native resource directory for the running platform."""
+    key = (sys.platform, platform.machine().lower())
+    try:
+        return os.path.join(_NATIVE_DIR, _PLATFORM_DIRS[key])
+    except KeyError:
+        raise ImportError(
+            f"Unsupported platform for coinswap bindings: {key[0]}-{key[1]}"
+        ) from None
+
+
+def load(name):
+    """Load the generated ``coinswap.py`` for this platform as module ``name``."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    path = os.path.join(native_dir(), "coinswap.py")
+    if not os.path.exists(path):
+        raise ImportError(f"Coinswap bindings not found at {path}")
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
@@ -0,0 +1,60 @@
+"""Minimal bitcoind JSON-RPC client shared by the Python swap tests"""
+
+import base64
+import http.client
+import json
+import select
+import threading
+
+RPC_HOST = "localhost"
+RPC_PORT = 18442
+RPC_AUTH = "Basic " + base64.b64encode(b"user:password").decode("ascii")
+# One keep-alive connection per thread, so worker threads can issue RPCs concurrently
+_rpc_local = threading.local()
+
+
+class RpcError(Exception):
+    """Error returned by the bitcoind JSON-RPC server"""
+
+
+def _connection():
+    """Return this thread's bitcoind connection, opening it on first use"""
+    conn = getattr(_rpc_local, "conn", None)
+    if conn is None:
+        conn = _rpc_local.conn = http.client.HTTPConnection(RPC_HOST, RPC_PORT, timeout=60)
+    elif conn.sock is not None and select.select([conn.sock], [], [], 0)[0]:
+        # An idle keep-alive socket only turns readable once bitcoind has closed it
+        conn.close()
+    return conn
+
+
+def rpc(method, params=None, wallet=None):
+    """Call a bitcoind JSON-RPC method, reusing a keep-alive HTTP connection across calls
+
+    A call is resent only if sending the request failed. Once it has been sent, a
+    lost reply raises instead, since bitcoind may already have acted on the call.
+    """
+    path = f"/wallet/{wallet}" if wallet else "/"
+    body = json.dumps({"jsonrpc": "1.0", "id": method, "method": method, "params": params or []})
+    headers = {"Authorization": RPC_AUTH, "Content-Type": "application/json"}
+    conn = _connection()
+    try:
+        conn.request("POST", path, body, headers)
+    except ConnectionError:
+        # The request never reached bitcoind; reconnect once and send it again
+        conn.close()
+        conn.request("POST", path, body, headers)
+    try:
+        response = conn.getresponse()
+    except (ConnectionError, http.client.HTTPException):
+        # Leave a clean connection for the next call, but do not resend this one
+        conn.close()
+        raise
+    payload = response.read()
+    try:
+        reply = json.loads(payload)
+    except ValueError:
+        raise RpcError(f"{method}: HTTP {response.status} {response.reason}") from None
+    if reply.get("error"):
+        raise RpcError(f"{method}: {reply['error'].get('message')}")
+    return reply["result"]
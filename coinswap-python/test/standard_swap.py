@@ -1,93 +1,106 @@
 import sys
 import os
-import subprocess
-import time 
+import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-bindings_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'coinswap', 'native', 'linux-x86_64'))
-sys.path.insert(0, bindings_path)
+from coinswap import Taker, SwapParams, RpcConfig, AddressType, TakerError
 
-from coinswap import Taker, SwapParams, RpcConfig, AddressType
+from bitcoind_rpc import RpcError, rpc
+from swap_utils import cleanup_wallet_files, format_balances, remove_path
 
-def cleanup_test_wallets():
-    """Clean up test wallet directories before running tests"""
-    import shutil
+P2WPKH = AddressType(addr_type="P2WPKH")
 
-    wallet_name = "python_legacy_wallet"
+WALLET_NAME = "python_legacy_wallet"
+TAKER_DATA_DIR = os.path.expanduser("~/.coinswap/taker")
+TAKER_WALLETS_DIR = os.path.join(TAKER_DATA_DIR, "wallets")
+BITCOIN_WALLET_DIR = os.path.expanduser(f"~/.bitcoin/regtest/wallets/{WALLET_NAME}")
+RPC_CONFIG = RpcConfig(
+    url="localhost:18442",
+    username="user",
+    password="password",
+    wallet_name=WALLET_NAME,
+)
 
-    wallets_dir = os.path.expanduser("~/.coinswap/taker/wallets")
-    if os.path.isdir(wallets_dir):
-        for entry in os.listdir(wallets_dir):
-            if not entry.startswith(wallet_name):
-                continue
-            wallet_path = os.path.join(wallets_dir, entry)
-            try:
-                if os.path.isdir(wallet_path):
-                    shutil.rmtree(wallet_path)
-                else:
-                    os.remove(wallet_path)
-                print(f"✓ Cleaned up {wallet_path}")
-            except Exception as e:
-                print(f"Warning: Could not clean {wallet_path}: {e}")
-    
-    bitcoin_wallet_dir = os.path.expanduser(f"~/.bitcoin/regtest/wallets/{wallet_name}")
-    if os.path.exists(bitcoin_wallet_dir):
-        try:
-            shutil.rmtree(bitcoin_wallet_dir)
-            print(f"✓ Cleaned up {bitcoin_wallet_dir}")
-        except Exception as e:
-            print(f"Warning: Could not clean {bitcoin_wallet_dir}: {e}")
-    
+
+def cleanup_bitcoind_wallet():
+    """Unload the wallet from bitcoind, then delete its wallet directory"""
     try:
-        subprocess.run(
-            ['bitcoin-cli', '-regtest', 'unloadwallet', wallet_name],
-            capture_output=True,
-            text=True,
-            check=False
-        )
+        rpc('unloadwallet', [WALLET_NAME])
     except Exception:
         pass
+
+    # Only delete the files once bitcoind no longer has the wallet open
+    if os.path.isdir(BITCOIN_WALLET_DIR):
+        try:
+            remove_path(BITCOIN_WALLET_DIR, True)
+            print(f"✓ Cleaned up {BITCOIN_WALLET_DIR}")
+        except Exception as e:
+            print(f"Warning: Could not clean {BITCOIN_WALLET_DIR}: {e}")
+
+
 def setup_funding_wallet(taker_address: str):
     """Create a funding wallet, mine blocks, and send BTC to taker address"""
     funding_wallet = "test"
     try:
-        result = subprocess.run(
-            ['docker', 'exec', 'coinswap-bitcoind', 'bitcoin-cli', '-regtest', '-rpcport=18442', f'-rpcwallet={funding_wallet}', '-rpcuser=user', '-rpcpassword=password', 'sendtoaddress', taker_address, '1.0'],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        txid = result.stdout.strip()
+        txid = rpc('sendtoaddress', [taker_address, 1.0], wallet=funding_wallet)
         print(f"✓ Sent 1.0 BTC to taker address (txid: {txid[:16]}...)")
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to send BTC: {e.stderr}")
+    except RpcError as e:
+        print(f"✗ Failed to send BTC: {e}")
         raise Exception("Could not send BTC to taker address") from e
     except Exception as e:
         print(f"✗ Unexpected error sending BTC: {e}")
         raise
 
-    time.sleep(1)
+    # Block until bitcoind has handed the new transactions to every loaded wallet,
+    # so the taker's next sync sees them without a fixed sleep
+    rpc('syncwithvalidationinterfacequeue')
+
+
+def print_offer_summary(makers):
+    """Print the makers returned by dump_offerbook_summary"""
+    print(f"✓ Successfully fetched offers")
+    print(f"  Total makers found: {len(makers)}")
+    
+    if len(makers) > 0:
+        lines = ["\n🎯 Maker Details:"]
+        for i, maker in enumerate(makers, 1):
+            lines.append(f"\n  Maker {i}:")
+            lines.append(f"    Address: {maker.address}")
+            if maker.retries is not None:
+                lines.append(f"    State: {maker.state_type} (retries: {maker.retries})")
+            else:
+                lines.append(f"    State: {maker.state_type}")
+            
+            if maker.protocol_type:
+                lines.append(f"    Protocol: {maker.protocol_type}")
+            
+            if maker.base_fee is not None:
+                lines.append(f"    Offer Details:")
+                lines.append(f"      Base Fee: {maker.base_fee} sats")
+                lines.append(f"      Amount Relative Fee: {maker.amount_relative_fee_pct}%")
+                lines.append(f"      Time Relative Fee: {maker.time_relative_fee_pct}%")
+                lines.append(f"      Required Confirms: {maker.required_confirms}")
+                lines.append(f"      Minimum Locktime: {maker.minimum_locktime}")
+                lines.append(f"      Min Size: {maker.min_size} sats")
+                lines.append(f"      Max Size: {maker.max_size} sats")
+            else:
+                lines.append(f"    Offer: None (no offer available)")
+        print("\n".join(lines))
+    else:
+        print("\n⚠️  No makers found in offerbook")
+
+
 def main():
     try:
         print("Cleaning up previous test data...")
-        cleanup_test_wallets()
+        cleanup_wallet_files(TAKER_WALLETS_DIR, WALLET_NAME, cleanup_bitcoind_wallet)
         print()
 
-        wallet_name = 'python_legacy_wallet'
-        
-        rpc_config = RpcConfig(
-            url="localhost:18442",
-            username="user",
-            password="password",
-            wallet_name=wallet_name,
-        )
-
         print("\nInitializing Taker...")
-        data_dir = os.path.expanduser("~/.coinswap/taker")
-        
         taker = Taker.init(
-                data_dir=data_dir,
-                wallet_file_name=wallet_name,
-                rpc_config=rpc_config,
+                data_dir=TAKER_DATA_DIR,
+                wallet_file_name=WALLET_NAME,
+                rpc_config=RPC_CONFIG,
                 control_port=9051,
                 tor_auth_password="coinswap",
                 zmq_addr="tcp://127.0.0.1:28332",
@@ -99,7 +112,7 @@ def main():
         # Setup logging after initialization
         print("\nSetting up logging...")
         try:
-            taker.setup_logging(data_dir=data_dir, log_level="Info")
+            taker.setup_logging(data_dir=TAKER_DATA_DIR, log_level="Info")
             print("✓ Logging configured (level: Info)")
         except Exception as e:
             print(f"⚠️  Warning: Could not setup logging: {e}")
@@ -112,72 +125,40 @@ def main():
         print("\n📡 Syncing offerbook...")
         print("Waiting for offerbook synchronization to complete...")
         try:
-            taker.sync_offerbook_and_wait()
+            taker.sync_offerbook_and_wait_with_timeout(60_000)
             print("Offerbook synchronized")
+        except TakerError.Timeout:
+            # A sync that is still running holds the taker lock, so every later call
+            # would block on it; fail here instead of hanging further down
+            raise
         except Exception as e:
             print(f"Error during offerbook sync: {e}")
         
-        print("\n📡 Attempting to fetch offers from makers...")
-        try:
-            offerbook = taker.fetch_offers()
-            print(f"✓ Successfully fetched offers")
-            print(f"  Total makers found: {len(offerbook.makers)}")
-            
-            if len(offerbook.makers) > 0:
-                print("\n🎯 Maker Details:")
-                for i, maker in enumerate(offerbook.makers, 1):
-                    print(f"\n  Maker {i}:")
-                    print(f"    Address: {maker.address.address}")
-                    print(f"    State: {maker.state.state_type}", end="")
-                    if maker.state.retries is not None:
-                        print(f" (retries: {maker.state.retries})")
-                    else:
-                        print()
-                    
-                    if maker.protocol:
-                        print(f"    Protocol: {maker.protocol.protocol_type}")
-                    
-                    if maker.offer:
-                        print(f"    Offer Details:")
-                        print(f"      Base Fee: {maker.offer.base_fee} sats")
-                        print(f"      Amount Relative Fee: {maker.offer.amount_relative_fee_pct}%")
-                        print(f"      Time Relative Fee: {maker.offer.time_relative_fee_pct}%")
-                        print(f"      Required Confirms: {maker.offer.required_confirms}")
-                        print(f"      Minimum Locktime: {maker.offer.minimum_locktime}")
-                        print(f"      Min Size: {maker.offer.min_size} sats")
-                        print(f"      Max Size: {maker.offer.max_size} sats")
-                    else:
-                        print(f"    Offer: None (no offer available)")
-            else:
-                print("\n⚠️  No makers found in offerbook")
-                
-        except Exception as e:
-            print(f"⚠️  Could not fetch offers: {e}")
-
-        print("\nSyncing wallet...")
-        taker.sync_and_save()
+        print("\nSyncing wallet and getting initial balances...")
+        balances = taker.sync_and_get_balances()
         print("✓ Wallet synced")
-
-        print("\nGetting initial balances...")
-        balances = taker.get_balances()
         print(f"Initial Balances: {balances}")
 
         print("\nGetting next external address...")
-        address = taker.get_next_external_address(AddressType(addr_type="P2WPKH"))
-        setup_funding_wallet(address.addr)
-        print(f"Address: {address.addr}")
+        address = taker.get_next_external_address(P2WPKH)
+
+        # Fetching offers talks to the makers and funding only talks to bitcoind,
+        # so let the fetch run in the background while the wallet is funded
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offers = executor.submit(taker.dump_offerbook_summary)
+            setup_funding_wallet(address.addr)
+            print(f"Address: {address.addr}")
+
+            print("\n📡 Attempting to fetch offers from makers...")
+            try:
+                print_offer_summary(offers.result())
+            except Exception as e:
+                print(f"⚠️  Could not fetch offers: {e}")
 
         print("\nSyncing wallet after funding...")
-        taker.sync_and_save()
+        balances = taker.sync_and_get_balances()
         print("✓ Wallet synced")
-
-        print("\nGetting updated balances...")
-        balances = taker.get_balances()
-        print(f"Updated Balances:")
-        print(f"  Spendable: {balances.spendable} sats")
-        print(f"  Regular: {balances.regular} sats")
-        print(f"  Swap: {balances.swap} sats")
-        print(f"  Fidelity: {balances.fidelity} sats")
+        print(format_balances("Updated Balances", balances))
 
         # Perform coinswap
         print("\n💱 Initiating coinswap...")
@@ -190,10 +171,12 @@ def main():
             manually_selected_outpoints=None,
             preferred_makers=None,
         )
-        print(f"Swap Parameters:")
-        print(f"  Send Amount: {swap_params.send_amount} sats")
-        print(f"  Maker Count: {swap_params.maker_count}")
-        print(f"  Protocol: {swap_params.protocol}")
+        print("\n".join([
+            "Swap Parameters:",
+            f"  Send Amount: {swap_params.send_amount} sats",
+            f"  Maker Count: {swap_params.maker_count}",
+            f"  Protocol: {swap_params.protocol}",
+        ]))
 
         print("\n🔄 Executing coinswap (this may take a while)...")
         swap_id = taker.prepare_coinswap(swap_params=swap_params)
@@ -201,37 +184,33 @@ def main():
         assert result is not None, "Coinswap should return a swap report"
 
         print(f"\n✅ Coinswap completed successfully!")
-        print(f"\nSwap Report:")
         outgoing_amount = getattr(result, "outgoing_amount", getattr(result, "target_amount", None))
         fee_value = getattr(result, "fee_paid", None)
         total_fee_paid = abs(fee_value) if fee_value is not None else None
-        print(f"  Swap ID: {result.swap_id}")
-        print(f"  Duration: {result.swap_duration_seconds:.2f} seconds")
-        print(f"  Outgoing/Target Amount: {outgoing_amount} sats")
-        print(f"  Total Fee Paid: {total_fee_paid} sats")
-        print(f"  Maker Fees: {result.total_maker_fees} sats")
-        print(f"  Mining Fee: {result.mining_fee} sats")
-        print(f"  Fee Percentage: {result.fee_percentage:.4f}%")
-        print(f"  Number of Makers Used: {result.makers_count}")
-        print(f"  Maker Addresses:")
-        for i, addr in enumerate(result.maker_addresses, 1):
-            print(f"    {i}. {addr}")
+        lines = [
+            "\nSwap Report:",
+            f"  Swap ID: {result.swap_id}",
+            f"  Duration: {result.swap_duration_seconds:.2f} seconds",
+            f"  Outgoing/Target Amount: {outgoing_amount} sats",
+            f"  Total Fee Paid: {total_fee_paid} sats",
+            f"  Maker Fees: {result.total_maker_fees} sats",
+            f"  Mining Fee: {result.mining_fee} sats",
+            f"  Fee Percentage: {result.fee_percentage:.4f}%",
+            f"  Number of Makers Used: {result.makers_count}",
+            "  Maker Addresses:",
+        ]
+        lines.extend(f"    {i}. {addr}" for i, addr in enumerate(result.maker_addresses, 1))
+        print("\n".join(lines))
 
         # Final balance check
         print("\n📊 Final balances after coinswap...")
-        taker.sync_and_save()
-        final_balances = taker.get_balances()
-        print(f"Final Balances:")
-        print(f"  Spendable: {final_balances.spendable} sats")
-        print(f"  Regular: {final_balances.regular} sats")
-        print(f"  Swap: {final_balances.swap} sats")
-        print(f"  Fidelity: {final_balances.fidelity} sats")
+        final_balances = taker.sync_and_get_balances()
+        print(format_balances("Final Balances", final_balances))
 
         print("\n✓ All tests completed!")
 
     except Exception as e:
         print(f"\n✗ Error: {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
@@ -0,0 +1,56 @@
+"""Wallet cleanup and output helpers shared by the Python swap tests"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+def find_wallet_entries(wallets_dir, wallet_name):
+    """Return (path, is_dir) for every entry in wallets_dir belonging to wallet_name"""
+    paths = []
+    try:
+        # scandir reports each entry's type from the directory listing, so no per-entry stat
+        with os.scandir(wallets_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith(wallet_name):
+                    paths.append((entry.path, entry.is_dir(follow_symlinks=False)))
+    except FileNotFoundError:
+        pass
+    return paths
+
+
+def remove_path(path, is_dir):
+    """Remove a file or directory tree"""
+    if is_dir:
+        shutil.rmtree(path)
+    else:
+        os.remove(path)
+
+
+def cleanup_wallet_files(wallets_dir, wallet_name, bitcoind_cleanup):
+    """Delete wallet_name's files in wallets_dir while bitcoind_cleanup runs alongside"""
+    paths = find_wallet_entries(wallets_dir, wallet_name)
+
+    # Local wallet files and the bitcoind wallet are independent, so clean them up
+    # concurrently; bitcoind_cleanup keeps its own order (unload before delete).
+    with ThreadPoolExecutor(max_workers=len(paths) + 1) as executor:
+        bitcoind = executor.submit(bitcoind_cleanup)
+        removals = [(path, executor.submit(remove_path, path, is_dir)) for path, is_dir in paths]
+        for path, removal in removals:
+            try:
+                removal.result()
+                print(f"✓ Cleaned up {path}")
+            except Exception as e:
+                print(f"Warning: Could not clean {path}: {e}")
+        bitcoind.result()
+
+
+def format_balances(title, balances):
+    """Render a Balances record as one printable block"""
+    return "\n".join([
+        f"{title}:",
+        f"  Spendable: {balances.spendable} sats",
+        f"  Regular: {balances.regular} sats",
+        f"  Swap: {balances.swap} sats",
+        f"  Fidelity: {balances.fidelity} sats",
+    ])
@@ -1,41 +1,31 @@
 import sys
 import os
 import subprocess
-import time 
-
-bindings_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src', 'coinswap', 'native', 'linux-x86_64'))
-sys.path.insert(0, bindings_path)
-
-from coinswap import Taker, SwapParams, RpcConfig, AddressType
-
-def cleanup_test_wallets():
-    """Clean up test wallet directories before running tests"""
-    import shutil
-    wallet_name = "python_taproot_wallet"
-
-    wallets_dir = os.path.expanduser("~/.coinswap/taker/wallets")
-    if os.path.isdir(wallets_dir):
-        for entry in os.listdir(wallets_dir):
-            if not entry.startswith(wallet_name):
-                continue
-            wallet_path = os.path.join(wallets_dir, entry)
-            try:
-                if os.path.isdir(wallet_path):
-                    shutil.rmtree(wallet_path)
-                else:
-                    os.remove(wallet_path)
-                print(f"✓ Cleaned up {wallet_path}")
-            except Exception as e:
-                print(f"Warning: Could not clean {wallet_path}: {e}")
-    
-    # Unload wallet from Docker bitcoind
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from coinswap import Taker, SwapParams, RpcConfig, AddressType, TakerError
+
+from bitcoind_rpc import RpcError, rpc
+from swap_utils import cleanup_wallet_files, format_balances
+
+P2TR = AddressType(addr_type="P2TR")
+
+WALLET_NAME = "python_taproot_wallet"
+# data_dir=None makes the taker use its default ~/.coinswap/taker
+TAKER_WALLETS_DIR = os.path.expanduser("~/.coinswap/taker/wallets")
+RPC_CONFIG = RpcConfig(
+    url="localhost:18442",
+    username="user",
+    password="password",
+    wallet_name=WALLET_NAME,
+)
+
+
+def cleanup_docker_wallet():
+    """Unload the wallet from Docker bitcoind, then delete its files in the container"""
     try:
-        subprocess.run(
-            ['docker', 'exec', 'coinswap-bitcoind', 'bitcoin-cli', '-regtest', '-rpcport=18442', '-rpcuser=user', '-rpcpassword=password', 'unloadwallet', wallet_name],
-            capture_output=True,
-            text=True,
-            check=False
-        )
+        rpc('unloadwallet', [WALLET_NAME])
         print("✓ Unloaded wallet from Docker bitcoind")
     except Exception:
         pass
@@ -43,13 +33,13 @@ def cleanup_test_wallets():
     # Remove the python_taproot_wallet wallet from the Docker container's bitcoin folder
     try:
         result = subprocess.run(
-            ['docker', 'exec', 'coinswap-bitcoind', 'rm', '-rf', f'/home/bitcoin/.bitcoin/wallets/{wallet_name}'],
-            capture_output=True,
-            text=True,
+            ['docker', 'exec', 'coinswap-bitcoind', 'rm', '-rf', f'/home/bitcoin/.bitcoin/wallets/{WALLET_NAME}'],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False
         )
         if result.returncode == 0:
-            print(f"✓ Removed {wallet_name} wallet from Docker container")
+            print(f"✓ Removed {WALLET_NAME} wallet from Docker container")
         else:
             print("⚠ Failed to remove wallet from Docker container (may not exist)")
     except Exception:
@@ -65,26 +55,32 @@ def setup_funding_wallet(taker):
     total_sats = 42749329
     quarter_sats = total_sats // 4
     parts = [quarter_sats, quarter_sats, quarter_sats, total_sats - quarter_sats * 3]
+    next_external_address = taker.get_next_external_address
     try:
-        for part_sats in parts:
-            taker_address = taker.get_next_external_address(AddressType(addr_type="P2TR")).addr
-            amount_btc = f"{part_sats / 1e8:.8f}"
-            result = subprocess.run(
-                ['docker', 'exec', 'coinswap-bitcoind', 'bitcoin-cli', '-regtest', '-rpcport=18442', f'-rpcwallet={funding_wallet}', '-rpcuser=user', '-rpcpassword=password', 'sendtoaddress', taker_address, amount_btc],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            txid = result.stdout.strip()
-            print(f"✓ Sent {amount_btc} BTC to {taker_address[:16]}... (txid: {txid[:16]}...)")
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Failed to send BTC: {e.stderr}")
+        sends = [
+            (next_external_address(P2TR).addr, f"{part_sats / 1e8:.8f}")
+            for part_sats in parts
+        ]
+        # The four sends are independent, so issue them concurrently rather than
+        # one round trip at a time (batching would make bitcoind buffer every reply)
+        with ThreadPoolExecutor(max_workers=len(sends)) as executor:
+            futures = [
+                executor.submit(rpc, 'sendtoaddress', [taker_address, amount_btc], wallet=funding_wallet)
+                for taker_address, amount_btc in sends
+            ]
+            for (taker_address, amount_btc), future in zip(sends, futures):
+                txid = future.result()
+                print(f"✓ Sent {amount_btc} BTC to {taker_address[:16]}... (txid: {txid[:16]}...)")
+    except RpcError as e:
+        print(f"✗ Failed to send BTC: {e}")
         raise Exception("Could not send BTC to taker address") from e
     except Exception as e:
         print(f"✗ Unexpected error sending BTC: {e}")
         raise
 
-    time.sleep(1)
+    # Block until bitcoind has handed the new transactions to every loaded wallet,
+    # so the taker's next sync sees them without a fixed sleep
+    rpc('syncwithvalidationinterfacequeue')
 
 
 def main():
@@ -94,24 +90,15 @@ def main():
         print("========================================\n")
 
         print("Cleaning up previous test data...")
-        cleanup_test_wallets()
+        cleanup_wallet_files(TAKER_WALLETS_DIR, WALLET_NAME, cleanup_docker_wallet)
         print()
 
-        wallet_name = 'python_taproot_wallet'
-        
-        rpc_config = RpcConfig(
-            url="localhost:18442",
-            username="user",
-            password="password",
-            wallet_name=wallet_name,
-        )
-
         print("\nInitializing Taker...")
         
         taker = Taker.init(
             data_dir=None,
-            wallet_file_name=wallet_name,
-            rpc_config=rpc_config,
+            wallet_file_name=WALLET_NAME,
+            rpc_config=RPC_CONFIG,
             control_port=9051,
             tor_auth_password="coinswap",
             zmq_addr="tcp://127.0.0.1:28332",
@@ -136,60 +123,53 @@ def main():
 
         print("\n📡 Syncing offerbook...")
         print("Waiting for offerbook synchronization to complete...")
-        taker.sync_offerbook_and_wait()
+        taker.sync_offerbook_and_wait_with_timeout(60_000)
         print("Offerbook synchronized")
 
         # Test address generation (external and internal)
         print("\nTesting address generation...")
-        external_address1 = taker.get_next_external_address(AddressType(addr_type="P2TR"))
+        external_address1 = taker.get_next_external_address(P2TR)
         print(f"External address 1: {external_address1.addr}")
         
-        external_address2 = taker.get_next_external_address(AddressType(addr_type="P2TR"))
+        external_address2 = taker.get_next_external_address(P2TR)
         print(f"External address 2: {external_address2.addr}")
         
         assert external_address1.addr != external_address2.addr, "External addresses should be unique"
         print("✓ External addresses are unique")
 
-        internal_addresses = taker.get_next_internal_addresses(3, AddressType(addr_type="P2TR"))
+        internal_addresses = taker.get_next_internal_addresses(3, P2TR)
         print(f"✓ Generated {len(internal_addresses)} internal addresses")
         print("✓ 'get_next_external_address' test passed")
         print("✓ 'get_next_internal_addresses' test passed")
 
         # Test initial balances
         print("\nTesting initial balances...")
-        taker.sync_and_save()
-        initial_balances = taker.get_balances()
+        initial_balances = taker.sync_and_get_balances()
 
-        print(f"Initial Balances:")
-        print(f"  Spendable: {initial_balances.spendable} sats")
-        print(f"  Regular: {initial_balances.regular} sats")
-        print(f"  Swap: {initial_balances.swap} sats")
-        print(f"  Fidelity: {initial_balances.fidelity} sats")
-        print("✓ 'get_balances' test passed (initial zero balances)")
+        print(format_balances("Initial Balances", initial_balances))
+        print("✓ 'sync_and_get_balances' test passed (initial zero balances)")
 
         # Fund the wallet
         print("\nFunding wallet...")
         setup_funding_wallet(taker)
-        taker.sync_and_save()
         print("✓ wallet funding completed")
 
         # Test updated balances after funding
         print("\nTesting updated balances after funding...")
-        updated_balances = taker.get_balances()
-
-        print(f"Updated Balances:")
-        print(f"  Spendable: {updated_balances.spendable} sats")
-        print(f"  Regular: {updated_balances.regular} sats")
-        print(f"  Swap: {updated_balances.swap} sats")
-        print(f"  Fidelity: {updated_balances.fidelity} sats")
-        print("✓ 'get_balances' test passed (post-funding balance verification)")
-
-        # Test list_all_utxo_spend_info
-        print("\nTesting list_all_utxo_spend_info...")
-        utxos = taker.list_all_utxo_spend_info()
-        assert len(utxos) > 0, "Should have at least 1 UTXO after funding"
-        print(f"Found {len(utxos)} UTXO(s)")
-        print("✓ list_all_utxo_spend_info test passed")
+        updated_balances = taker.sync_and_get_balances()
+
+        print(format_balances("Updated Balances", updated_balances))
+        print("✓ 'sync_and_get_balances' test passed (post-funding balance verification)")
+
+        # Test full_status (wallet name, balances and UTXO/transaction counts in one call)
+        print("\nTesting full_status...")
+        status = taker.full_status()
+        assert status.wallet_name == WALLET_NAME, "Wallet name should match"
+        assert status.balances.spendable == updated_balances.spendable, "Status balance should match synced balance"
+        assert status.utxo_count > 0, "Should have at least 1 UTXO after funding"
+        assert status.tx_count > 0, "Should have at least 1 transaction after funding"
+        print(f"Found {status.utxo_count} UTXO(s) and {status.tx_count} transaction(s)")
+        print("✓ 'full_status' test passed")
 
         # Test get_transactions
         print("\nTesting get_transactions...")
@@ -198,11 +178,24 @@ def main():
         print(f"Found {len(transactions)} transaction(s)")
         print("✓ 'get_transactions' test passed")
 
-        # Fetch offers
+        # Test get_transaction_rows
+        print("\nTesting get_transaction_rows...")
+        rows = taker.get_transaction_rows(None, None)
+        assert len(rows) == len(transactions), "Should return one row per transaction"
+        print("\n".join(
+            f"  {row.txid[:16]}... {row.category}: {row.amount_sats} sats ({row.confirmations} confirmations)"
+            for row in rows
+        ))
+        print("✓ 'get_transaction_rows' test passed")
+
+        # Fetch offers. A timed-out fetch keeps the taker locked, so only that error
+        # fails the test here rather than block the swap below.
         print("\n📡 Fetching offers from makers...")
         try:
-            fetch_offers_result = taker.fetch_offers()
+            fetch_offers_result = taker.fetch_offers_with_timeout(timeout_secs=10)
             print(f"Fetch offers result: {fetch_offers_result}")
+        except TakerError.Timeout:
+            raise
         except Exception as e:
             print(f"⚠️  Could not fetch offers: {e}")
 
@@ -218,12 +211,14 @@ def main():
             preferred_makers=None,
         )
         
-        print(f"Swap Parameters:")
-        print(f"  Send Amount: {swap_params.send_amount} sats")
-        print(f"  Maker Count: {swap_params.maker_count}")
-        print(f"  TX Count: {swap_params.tx_count}")
-        print(f"  Required Confirms: {swap_params.required_confirms}")
-        print(f"  Protocol: {swap_params.protocol}")
+        print("\n".join([
+            "Swap Parameters:",
+            f"  Send Amount: {swap_params.send_amount} sats",
+            f"  Maker Count: {swap_params.maker_count}",
+            f"  TX Count: {swap_params.tx_count}",
+            f"  Required Confirms: {swap_params.required_confirms}",
+            f"  Protocol: {swap_params.protocol}",
+        ]))
 
         print("\n🔄 Executing taproot coinswap (this may take a while)...")
         swap_id = taker.prepare_coinswap(swap_params=swap_params)
@@ -231,32 +226,29 @@ def main():
         assert swap_report is not None, "Taproot coinswap should return a swap report"
 
         print("\n✅ Swap completed successfully!")
-        print(f"\nSwap Report:")
         outgoing_amount = getattr(swap_report, "outgoing_amount", getattr(swap_report, "target_amount", None))
         fee_value = getattr(swap_report, "fee_paid", None)
         total_fee_paid = abs(fee_value) if fee_value is not None else None
-        print(f"  Swap ID: {swap_report.swap_id}")
-        print(f"  Duration: {swap_report.swap_duration_seconds:.2f} seconds")
-        print(f"  Outgoing/Target Amount: {outgoing_amount} sats")
-        print(f"  Total Fee Paid: {total_fee_paid} sats")
-        print(f"  Maker Fees: {swap_report.total_maker_fees} sats")
-        print(f"  Mining Fee: {swap_report.mining_fee} sats")
-        print(f"  Fee Percentage: {swap_report.fee_percentage:.4f}%")
-        print(f"  Number of Makers Used: {swap_report.makers_count}")
-        print(f"  Maker Addresses:")
-        for i, addr in enumerate(swap_report.maker_addresses, 1):
-            print(f"    {i}. {addr}")
+        lines = [
+            "\nSwap Report:",
+            f"  Swap ID: {swap_report.swap_id}",
+            f"  Duration: {swap_report.swap_duration_seconds:.2f} seconds",
+            f"  Outgoing/Target Amount: {outgoing_amount} sats",
+            f"  Total Fee Paid: {total_fee_paid} sats",
+            f"  Maker Fees: {swap_report.total_maker_fees} sats",
+            f"  Mining Fee: {swap_report.mining_fee} sats",
+            f"  Fee Percentage: {swap_report.fee_percentage:.4f}%",
+            f"  Number of Makers Used: {swap_report.makers_count}",
+            "  Maker Addresses:",
+        ]
+        lines.extend(f"    {i}. {addr}" for i, addr in enumerate(swap_report.maker_addresses, 1))
+        print("\n".join(lines))
         print("✓ 'prepare_coinswap' and 'start_coinswap' test passed")
 
         # Final balance check
         print("\n📊 Final balances after swap...")
-        taker.sync_and_save()
-        final_balances = taker.get_balances()
-        print(f"Final Balances:")
-        print(f"  Spendable: {final_balances.spendable} sats")
-        print(f"  Regular: {final_balances.regular} sats")
-        print(f"  Swap: {final_balances.swap} sats")
-        print(f"  Fidelity: {final_balances.fidelity} sats")
+        final_balances = taker.sync_and_get_balances()
+        print(format_balances("Final Balances", final_balances))
 
         print("\n========================================")
         print("All FFI method tests completed successfully!")
@@ -264,7 +256,6 @@ def main():
 
     except Exception as e:
         print(f"\n✗ Error: {type(e).__name__}: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 
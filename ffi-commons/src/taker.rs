@@ -5,10 +5,10 @@
 use crate::{
     AddressType,
     types::{
-        Address, Amount, Balances, GetTransactionResultDetail, ListTransactionResult,
-        ListUnspentResultEntry, MakerOfferCandidate, Offer, OfferBook, OutPoint, RPCConfig,
-        ScriptBuf, SignedAmountSats, SwapReport, TakerError, TotalUtxoInfo, Txid, UtxoSpendInfo,
-        WalletTxInfo,
+        Address, Amount, Balances, FullStatus, GetTransactionResultDetail, ListTransactionResult,
+        ListUnspentResultEntry, MakerOfferCandidate, Offer, OfferBook, OfferSummary, OutPoint,
+        RPCConfig, ScriptBuf, SignedAmountSats, SwapReport, TakerError, TotalUtxoInfo, TxRow, Txid,
+        UtxoSpendInfo, WalletTxInfo,
     },
 };
 use coinswap::{
@@ -21,7 +21,12 @@ use coinswap::{
 };
 use std::{
     path::PathBuf,
-    sync::{Arc, Mutex},
+    sync::{
+        Arc, Mutex,
+        mpsc::{self, RecvTimeoutError},
+    },
+    thread,
+    time::Duration,
 };
 
 /// Swap specific parameters. These are user's policy and can differ among swaps.
@@ -46,12 +51,38 @@ pub struct SwapParams {
     pub preferred_makers: Option<Vec<String>>,
 }
 
+/// Page size used by [`Taker::full_status`] to count wallet transactions.
+const TX_COUNT_PAGE_SIZE: usize = 1000;
+
 fn checked_satoshi_amount(amount: i64) -> Result<u64, TakerError> {
     u64::try_from(amount).map_err(|_| TakerError::General {
         msg: "Amount must be non-negative".to_string(),
     })
 }
 
+/// Runs `job` on a worker thread and waits up to `timeout` for its result.
+///
+/// Returns `Ok(None)` if the timeout elapsed first. The job is not cancelled: it keeps
+/// running in the background (holding any lock it took) until it completes.
+fn run_with_timeout<T, F>(timeout: Duration, job: F) -> Result<Option<T>, TakerError>
+where
+    T: Send + 'static,
+    F: FnOnce() -> Result<T, TakerError> + Send + 'static,
+{
+    let (tx, rx) = mpsc::channel();
+    thread::spawn(move || {
+        let _ = tx.send(job());
+    });
+
+    match rx.recv_timeout(timeout) {
+        Ok(result) => result.map(Some),
+        Err(RecvTimeoutError::Timeout) => Ok(None),
+        Err(RecvTimeoutError::Disconnected) => Err(TakerError::General {
+            msg: "Taker worker thread exited unexpectedly".to_string(),
+        }),
+    }
+}
+
 /// SwapParams govern the criteria to find suitable set of makers from the offerbook.
 impl TryFrom<SwapParams> for CoinswapSwapParams {
     type Error = TakerError;
@@ -102,6 +133,9 @@ impl TryFrom<SwapParams> for CoinswapSwapParams {
 /// The Taker structure that performs bulk of the coinswap protocol. Taker connects
 /// to multiple Makers and send protocol messages sequentially to them. The communication
 /// sequence and corresponding SwapCoin infos are stored in `ongoing_swap_state`.
+///
+/// The object can be shared across threads, but every method takes the same inner lock,
+/// so calls made concurrently from a host-language thread pool run one after another.
 #[derive(uniffi::Object)]
 pub struct Taker {
     /// The Taker structure that performs bulk of the coinswap protocol.
@@ -259,6 +293,36 @@ impl Taker {
             .collect())
     }
 
+    /// Returns recent transactions (by default last 10) as flat rows of txid,
+    /// confirmations, signed amount and category.
+    pub fn get_transaction_rows(
+        &self,
+        count: Option<u32>,
+        skip: Option<u32>,
+    ) -> Result<Vec<TxRow>, TakerError> {
+        let taker = self.taker.lock().map_err(|_| TakerError::General {
+            msg: "Failed to acquire taker lock".to_string(),
+        })?;
+        let wallet = taker.get_wallet().read().map_err(|_| TakerError::General {
+            msg: "Failed to acquire wallet read lock".to_string(),
+        })?;
+        let txns = wallet
+            .get_transactions(count.map(|c| c as usize), skip.map(|s| s as usize))
+            .map_err(|e| TakerError::Wallet {
+                msg: format!("Get Transactions Error: {:?}", e),
+            })?;
+
+        Ok(txns
+            .into_iter()
+            .map(|tx| TxRow {
+                txid: tx.info.txid.to_string(),
+                confirmations: tx.info.confirmations,
+                amount_sats: tx.detail.amount.to_sat(),
+                category: format!("{:?}", tx.detail.category),
+            })
+            .collect())
+    }
+
     /// Gets the next internal addresses from the HD keychain.
     pub fn get_next_internal_addresses(
         &self,
@@ -565,6 +629,67 @@ impl Taker {
         Ok(())
     }
 
+    /// Returns the wallet name, balances, UTXO count and total transaction count,
+    /// all read from one wallet snapshot under a single lock acquisition.
+    ///
+    /// This does not sync the wallet; call [`Taker::sync_and_save`] first for fresh data.
+    pub fn full_status(&self) -> Result<FullStatus, TakerError> {
+        let taker = self.taker.lock().map_err(|_| TakerError::General {
+            msg: "Failed to acquire taker lock".to_string(),
+        })?;
+        let wallet = taker.get_wallet().read().map_err(|_| TakerError::General {
+            msg: "Failed to acquire wallet read lock".to_string(),
+        })?;
+        let balances = wallet.get_balances().map_err(|e| TakerError::Wallet {
+            msg: format!("Get balances error: {:?}", e),
+        })?;
+        // get_transactions returns at most `count` entries (10 by default), so page
+        // through the history to count every wallet transaction.
+        let mut tx_count = 0;
+        loop {
+            let page = wallet
+                .get_transactions(Some(TX_COUNT_PAGE_SIZE), Some(tx_count))
+                .map_err(|e| TakerError::Wallet {
+                    msg: format!("Get Transactions Error: {:?}", e),
+                })?
+                .len();
+            tx_count += page;
+            if page < TX_COUNT_PAGE_SIZE {
+                break;
+            }
+        }
+
+        Ok(FullStatus {
+            wallet_name: wallet.get_name().to_string(),
+            balances: Balances::from(balances),
+            utxo_count: wallet.list_all_utxo_spend_info().len() as u32,
+            tx_count: tx_count as u32,
+        })
+    }
+
+    /// Synchronizes the wallet, saves it to disk and returns the updated balances.
+    ///
+    /// Equivalent to [`Taker::sync_and_save`] followed by [`Taker::get_balances`], but
+    /// both run under a single acquisition of the taker and wallet locks.
+    pub fn sync_and_get_balances(&self) -> Result<Balances, TakerError> {
+        let taker = self.taker.lock().map_err(|_| TakerError::General {
+            msg: "Failed to acquire taker lock".to_string(),
+        })?;
+        let mut wallet = taker
+            .get_wallet()
+            .write()
+            .map_err(|_| TakerError::General {
+                msg: "Failed to acquire wallet write lock".to_string(),
+            })?;
+        wallet.sync_and_save().map_err(|e| TakerError::Wallet {
+            msg: format!("Sync wallet error: {:?}", e),
+        })?;
+        let balances = wallet.get_balances().map_err(|e| TakerError::Wallet {
+            msg: format!("Get balances error: {:?}", e),
+        })?;
+        Ok(Balances::from(balances))
+    }
+
     /// Runs a full offerbook sync cycle and blocks until it completes.
     pub fn sync_offerbook_and_wait(&self) -> Result<(), TakerError> {
         let taker = self.taker.lock().map_err(|e| TakerError::General {
@@ -581,6 +706,24 @@ impl Taker {
         Ok(())
     }
 
+    /// Runs a full offerbook sync cycle, failing with [`TakerError::Timeout`] if it does
+    /// not complete within `timeout_ms`.
+    ///
+    /// A timeout is fatal for this taker: the sync keeps running on its worker thread and
+    /// holds the taker lock until it completes, so every subsequent call blocks on it.
+    /// Drop the taker after a timeout instead of carrying on.
+    pub fn sync_offerbook_and_wait_with_timeout(
+        self: Arc<Self>,
+        timeout_ms: u64,
+    ) -> Result<(), TakerError> {
+        run_with_timeout(Duration::from_millis(timeout_ms), move || {
+            self.sync_offerbook_and_wait()
+        })?
+        .ok_or_else(|| TakerError::Timeout {
+            msg: format!("Offerbook sync timed out after {}ms", timeout_ms),
+        })
+    }
+
     /// Polls a single maker, verifies its fidelity proof, stores it in the offerbook, and returns the maker's final state.
     pub fn poll_maker(&self, address: String) -> Result<MakerOfferCandidate, TakerError> {
         let taker = self.taker.lock().map_err(|_| TakerError::General {
@@ -617,6 +760,43 @@ impl Taker {
         Ok(OfferBook::from(&offerbook))
     }
 
+    /// Returns the OfferBook, failing with [`TakerError::Timeout`] if it takes longer
+    /// than `timeout_secs` to fetch.
+    ///
+    /// On timeout the fetch keeps running in the background and holds the taker lock
+    /// until it completes, so subsequent calls block until it has finished.
+    pub fn fetch_offers_with_timeout(
+        self: Arc<Self>,
+        timeout_secs: u64,
+    ) -> Result<OfferBook, TakerError> {
+        run_with_timeout(Duration::from_secs(timeout_secs), move || {
+            self.fetch_offers()
+        })?
+        .ok_or_else(|| TakerError::Timeout {
+            msg: format!("Fetch offers timed out after {}s", timeout_secs),
+        })
+    }
+
+    /// Returns a flattened summary of every maker in the OfferBook.
+    ///
+    /// Unlike [`Taker::fetch_offers`], each entry only carries primitive fields, so the
+    /// whole offerbook crosses the FFI boundary in one call without nested records.
+    pub fn dump_offerbook_summary(&self) -> Result<Vec<OfferSummary>, TakerError> {
+        let taker = self.taker.lock().map_err(|_| TakerError::General {
+            msg: "Failed to acquire taker lock".to_string(),
+        })?;
+
+        let offerbook = taker.fetch_offers().map_err(|e| TakerError::Network {
+            msg: format!("Fetch offers error: {:?}", e),
+        })?;
+
+        Ok(offerbook
+            .all_makers()
+            .into_iter()
+            .map(OfferSummary::from)
+            .collect())
+    }
+
     /// Displays a maker offer candidate in a human-readable format.
     /// If the maker does not yet have an offer, a partial view is shown.
     pub fn display_offer(&self, maker_offer: &Offer) -> Result<String, TakerError> {
@@ -697,3 +877,46 @@ mod security_tests {
         assert_eq!(checked_satoshi_amount(50_000).unwrap(), 50_000);
     }
 }
+
+#[cfg(test)]
+mod run_with_timeout_tests {
+    use super::run_with_timeout;
+    use crate::types::TakerError;
+    use std::{sync::mpsc, time::Duration};
+
+    #[test]
+    fn returns_the_job_result_when_it_finishes_in_time() {
+        let result = run_with_timeout(Duration::from_secs(5), || Ok(42)).unwrap();
+        assert_eq!(result, Some(42));
+    }
+
+    #[test]
+    fn propagates_the_job_error() {
+        let result: Result<Option<()>, _> = run_with_timeout(Duration::from_secs(5), || {
+            Err(TakerError::Network {
+                msg: "boom".to_string(),
+            })
+        });
+        assert!(matches!(result, Err(TakerError::Network { msg }) if msg == "boom"));
+    }
+
+    #[test]
+    fn returns_none_when_the_timeout_elapses() {
+        let (release_tx, release_rx) = mpsc::channel::<()>();
+        let result = run_with_timeout(Duration::from_millis(10), move || {
+            let _ = release_rx.recv();
+            Ok(())
+        })
+        .unwrap();
+        assert_eq!(result, None);
+        // Let the detached job finish instead of parking it for the rest of the run.
+        let _ = release_tx.send(());
+    }
+
+    #[test]
+    fn reports_a_job_that_exits_without_a_result() {
+        let result: Result<Option<()>, _> =
+            run_with_timeout(Duration::from_secs(5), || panic!("job panicked"));
+        assert!(matches!(result, Err(TakerError::General { .. })));
+    }
+}
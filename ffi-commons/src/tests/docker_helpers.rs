@@ -34,25 +34,36 @@ impl DockerBitcoind {
         Ok(Self { client })
     }
 
-    /// Send funds to an address using the 'test' wallet
-    pub fn send_to_address_from_funding_wallet(
-        &self,
-        address: &bitcoin::Address,
-        amount: bitcoin::Amount,
-    ) -> Result<bitcoin::Txid, String> {
+    /// Connect to the 'test' funding wallet
+    fn funding_wallet_client(&self) -> Result<Client, String> {
         let test_wallet_url = format!("{}/wallet/{}", DOCKER_BITCOIN_RPC_URL, "test");
-        let test_client = Client::new(
+        Client::new(
             &test_wallet_url,
             Auth::UserPass(
                 DOCKER_BITCOIN_RPC_USER.to_string(),
                 DOCKER_BITCOIN_RPC_PASS.to_string(),
             ),
         )
-        .map_err(|e| format!("Failed to connect to test wallet: {}", e))?;
+        .map_err(|e| format!("Failed to connect to test wallet: {}", e))
+    }
 
-        let txid = test_client
+    /// Send funds to an address using the 'test' wallet
+    ///
+    /// The send is left unconfirmed; call [`Self::mine_blocks`] once after all
+    /// sends to confirm them together.
+    pub fn send_to_address_from_funding_wallet(
+        &self,
+        address: &bitcoin::Address,
+        amount: bitcoin::Amount,
+    ) -> Result<bitcoin::Txid, String> {
+        self.funding_wallet_client()?
             .send_to_address(address, amount, None, None, None, None, None, None)
-            .map_err(|e| format!("Failed to send to address from test wallet: {}", e))?;
+            .map_err(|e| format!("Failed to send to address from test wallet: {}", e))
+    }
+
+    /// Mine `count` blocks to a fresh address of the 'test' wallet
+    pub fn mine_blocks(&self, count: u64) -> Result<(), String> {
+        let test_client = self.funding_wallet_client()?;
 
         let address = test_client
             .get_new_address(None, None)
@@ -61,10 +72,10 @@ impl DockerBitcoind {
             .map_err(|e| format!("Failed to require network: {}", e))?;
 
         test_client
-            .generate_to_address(1, &address)
+            .generate_to_address(count, &address)
             .map_err(|e| format!("Failed to generate blocks: {}", e))?;
 
-        Ok(txid)
+        Ok(())
     }
 
     #[allow(dead_code)]
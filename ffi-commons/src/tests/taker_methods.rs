@@ -204,17 +204,17 @@ fn test_taker_complete_flow() {
     let _txid = bitcoind
         .send_to_address_from_funding_wallet(&funding_address, fund_amount)
         .unwrap();
-    taker.sync_and_save().unwrap();
+    bitcoind.mine_blocks(1).unwrap();
     println!("✓ wallet funding completed");
 
     println!("\nTesting updated balances after funding...");
-    let updated_balances = taker.get_balances().unwrap();
+    let updated_balances = taker.sync_and_get_balances().unwrap();
     assert_eq!(
         updated_balances.spendable,
         fund_amount.to_sat() as i64,
         "Spendable balance should be 42749329 SATS"
     );
-    println!("✓ 'get_balances' test passed (post-funding balance verification)");
+    println!("✓ 'sync_and_get_balances' test passed (post-funding balance verification)");
 
     println!("\nTesting list_utxos...");
     let utxos = taker.list_all_utxo_spend_info();
@@ -261,11 +261,9 @@ fn test_taker_complete_flow() {
     println!("Swap Report: {:?}", report);
     println!("✓ 'prepare_coinswap' and 'start_coinswap' tests passed");
 
-    taker.sync_and_save().unwrap();
-
     println!(
         "\nTesting updated balances after swap...{:?}",
-        taker.get_balances()
+        taker.sync_and_get_balances()
     );
 
     println!("\n========================================");
@@ -8,6 +8,7 @@
 use crate::{
     taker::{SwapParams, Taker},
     tests::docker_helpers::{self, DockerBitcoind},
+    types::TakerError,
 };
 use bitcoin::Amount;
 use bitcoind::bitcoincore_rpc::RpcApi;
@@ -222,17 +223,18 @@ fn test_taproot_taker_complete_flow() {
             .send_to_address_from_funding_wallet(&addr, Amount::from_sat(part_sats))
             .unwrap();
     }
-    taker.sync_and_save().unwrap();
+    // Confirm all four sends with a single block
+    bitcoind.mine_blocks(1).unwrap();
     println!("✓ wallet funding completed");
 
     println!("\nTesting updated balances after funding...");
-    let updated_balances = taker.get_balances().unwrap();
+    let updated_balances = taker.sync_and_get_balances().unwrap();
     assert_eq!(
         updated_balances.spendable,
         fund_amount.to_sat() as i64,
         "Spendable balance should be 42749329 SATS"
     );
-    println!("✓ 'get_balances' test passed (post-funding balance verification)");
+    println!("✓ 'sync_and_get_balances' test passed (post-funding balance verification)");
 
     println!("\nTesting list_utxos...");
     let utxos = taker.list_all_utxo_spend_info();
@@ -256,8 +258,19 @@ fn test_taproot_taker_complete_flow() {
     println!("Found {} transaction(s)", transactions.len());
     println!("✓ 'get_transactions' test passed");
 
-    let fetch_offers_result = taker.fetch_offers();
+    println!("\nTesting full_status...");
+    let status = taker.full_status().expect("'full_status' should succeed");
+    assert_eq!(status.balances.spendable, updated_balances.spendable);
+    assert_eq!(status.utxo_count as usize, utxos.len());
+    assert_eq!(status.tx_count as usize, transactions.len());
+    println!("✓ 'full_status' test passed");
+
+    let fetch_offers_result = taker.clone().fetch_offers_with_timeout(10);
     println!("Fetch offers result: {:?}", fetch_offers_result);
+    // A timed-out fetch still holds the taker lock, which would block the swap below
+    if let Err(TakerError::Timeout { msg }) = &fetch_offers_result {
+        panic!("'fetch_offers_with_timeout' timed out: {}", msg);
+    }
 
     println!("\nTesting prepare_coinswap + start_coinswap...");
     let swap_params = SwapParams {
@@ -279,11 +292,9 @@ fn test_taproot_taker_complete_flow() {
     println!("Swap Report: {:?}", report);
     println!("✓ 'prepare_coinswap' and 'start_coinswap' tests passed");
 
-    taker.sync_and_save().unwrap();
-
     println!(
         "\nTesting updated balances after swap...{:?}",
-        taker.get_balances()
+        taker.sync_and_get_balances()
     );
 
     println!("\n========================================");
@@ -71,6 +71,9 @@ pub enum TakerError {
     /// General error with a custom message
     #[error("General error: {msg}")]
     General { msg: String },
+    /// Operation did not finish within its timeout.
+    #[error("Timeout error: {msg}")]
+    Timeout { msg: String },
     /// Standard input/output error.
     #[error("IO error: {msg}")]
     IO { msg: String },
@@ -130,6 +133,19 @@ impl From<CoinswapBalances> for Balances {
     }
 }
 
+/// Snapshot of the wallet's name, balances and UTXO/transaction counts.
+#[derive(Debug, uniffi::Record)]
+pub struct FullStatus {
+    /// The wallet name
+    pub wallet_name: String,
+    /// Current wallet balances
+    pub balances: Balances,
+    /// Number of UTXOs tracked by the wallet
+    pub utxo_count: u32,
+    /// Total number of wallet transactions
+    pub tx_count: u32,
+}
+
 #[derive(Clone, Debug, uniffi::Record)]
 pub struct OutPoint {
     pub txid: Txid,
@@ -191,6 +207,19 @@ pub struct GetTransactionResultDetail {
     pub abandoned: Option<bool>,
 }
 
+/// Flattened wallet transaction row, carrying only the commonly displayed fields.
+#[derive(Clone, Debug, uniffi::Record)]
+pub struct TxRow {
+    /// Transaction id as a hex string
+    pub txid: String,
+    /// Number of confirmations
+    pub confirmations: i32,
+    /// Signed amount in sats (negative for sends)
+    pub amount_sats: i64,
+    /// Transaction category, e.g. "Receive" or "Send"
+    pub category: String,
+}
+
 #[derive(Debug, Clone, uniffi::Record)]
 pub struct Amount {
     pub sats: i64,
@@ -538,6 +567,56 @@ impl From<&csOfferBook> for OfferBook {
     }
 }
 
+/// Flattened view of a maker and its offer, using primitive fields only.
+///
+/// Offer fields are `None` when the maker does not currently have an offer.
+#[derive(Debug, Clone, uniffi::Record)]
+pub struct OfferSummary {
+    /// Maker Address: onion_addr:port
+    pub address: String,
+    /// State type: "Good", "Unresponsive", or "Bad"
+    pub state_type: String,
+    /// Number of retries (only for Unresponsive state)
+    pub retries: Option<u8>,
+    /// Protocol type: "Legacy", "Taproot" or "Unified", if known
+    pub protocol_type: Option<String>,
+    /// Base fee charged per swap in satoshis
+    pub base_fee: Option<i64>,
+    /// Percentage fee relative to swap amount
+    pub amount_relative_fee_pct: Option<f64>,
+    /// Percentage fee for time-locked funds
+    pub time_relative_fee_pct: Option<f64>,
+    /// Minimum confirmations required before proceeding with swap
+    pub required_confirms: Option<u32>,
+    /// Minimum timelock duration in blocks for contract transactions
+    pub minimum_locktime: Option<u16>,
+    /// Minimum swap amount accepted in sats
+    pub min_size: Option<i64>,
+    /// Maximum swap amount accepted in sats
+    pub max_size: Option<i64>,
+}
+
+impl From<csMakerOfferCandidate> for OfferSummary {
+    fn from(maker: csMakerOfferCandidate) -> Self {
+        let state = MakerState::from(maker.state);
+        let offer = maker.offer.as_ref();
+
+        Self {
+            address: maker.address.to_string(),
+            state_type: state.state_type,
+            retries: state.retries,
+            protocol_type: maker.protocol.map(|p| MakerProtocol::from(p).protocol_type),
+            base_fee: offer.map(|o| o.base_fee as i64),
+            amount_relative_fee_pct: offer.map(|o| o.amount_relative_fee_pct),
+            time_relative_fee_pct: offer.map(|o| o.time_relative_fee_pct),
+            required_confirms: offer.map(|o| o.required_confirms),
+            minimum_locktime: offer.map(|o| o.minimum_locktime),
+            min_size: offer.map(|o| o.min_size as i64),
+            max_size: offer.map(|o| o.max_size as i64),
+        }
+    }
+}
+
 /// Information about individual maker fees in a swap
 #[derive(Debug, Clone, uniffi::Record)]
 pub struct MakerFeeInfo {